@@ -9,11 +9,20 @@ import queue
 import time
 import os
 import signal
+import re
 from typing import Optional, Callable
 from dataclasses import dataclass
 from enum import Enum
 from PyQt6.QtCore import QObject, pyqtSignal, QThread, QMutex, QWaitCondition
 
+# Commands containing any of these (case-insensitive) are refused
+DANGEROUS_PATTERNS = [
+    'rm -rf /', 'dd if=', 'mkfs.', 'fdisk', 'parted',
+    ':(){ :|:& };:', 'chmod -R 777 /', 'format', 'erase'
+]
+# One alternation scans the command once instead of once per pattern
+DANGEROUS_COMMAND_RE = re.compile("|".join(map(re.escape, DANGEROUS_PATTERNS)), re.IGNORECASE)
+
 class CommandStatus(Enum):
     """Command execution status"""
     PENDING = "pending"
@@ -149,13 +158,7 @@ class CommandExecutor(QObject):
 
     def is_command_safe(self, command: str) -> bool:
         """Enhanced Command Safety Check"""
-        dangerous_patterns = [
-            'rm -rf /', 'dd if=', 'mkfs.', 'fdisk', 'parted',
-            ':(){ :|:& };:', 'chmod -R 777 /', 'format', 'erase'
-        ]
-
-        command_lower = command.lower()
-        return not any(pattern in command_lower for pattern in dangerous_patterns)
+        return DANGEROUS_COMMAND_RE.search(command) is None
 
     def check_pacman_lock(self) -> bool:
         """Check if Pacman is locked"""
@@ -461,7 +464,8 @@ class CommandExecutor(QObject):
         try:
             result = subprocess.run(['which', 'sudo'], capture_output=True, timeout=5)
             return result.returncode == 0
-        except:
+        except (OSError, subprocess.SubprocessError) as e:
+            print(f"⚠️ sudo availability check failed: {e}")
             return False
 
     def reset_sudo_cache(self):
@@ -8,9 +8,13 @@ import os
 import yaml
 import hashlib
 from typing import Dict, List, Optional
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import datetime, timedelta
 
+# Display limits used by the tool cards
+CMD_PREVIEW_LENGTH = 70
+MAX_VISIBLE_TAGS = 3
+
 @dataclass
 class ConfigItem:
     """Single configuration item"""
@@ -21,12 +25,29 @@ class ConfigItem:
     tags: List[str] = None
     requires: List[str] = None
 
+    # Display values derived once at load time
+    cmd_preview: str = field(init=False, repr=False, compare=False, default="")
+    visible_tags: List[str] = field(init=False, repr=False, compare=False, default=None)
+    extra_tag_count: int = field(init=False, repr=False, compare=False, default=0)
+    category_text: str = field(init=False, repr=False, compare=False, default="")
+    # Lowercased name, description and tags for search, one field per line
+    search_text: str = field(init=False, repr=False, compare=False, default="")
+
     def __post_init__(self):
         if self.tags is None:
             self.tags = []
         if self.requires is None:
             self.requires = []
 
+        self.cmd_preview = self.command
+        if len(self.command) > CMD_PREVIEW_LENGTH:
+            self.cmd_preview = self.command[:CMD_PREVIEW_LENGTH - 3] + "..."
+        self.visible_tags = self.tags[:MAX_VISIBLE_TAGS]
+        self.extra_tag_count = max(0, len(self.tags) - MAX_VISIBLE_TAGS)
+        self.category_text = f"📂 {self.category}" if self.category else ""
+        # YAML may load tags such as 2024 as numbers
+        self.search_text = "\n".join([self.name, self.description, *map(str, self.tags)]).lower()
+
 @dataclass
 class ConfigCategory:
     """Configuration category with items"""
@@ -208,9 +229,7 @@ class ConfigManager:
 
         for category in self.config_data.values():
             for item in category.items:
-                if (search_term in item.name.lower() or
-                    search_term in item.description.lower() or
-                    any(search_term in tag.lower() for tag in item.tags)):
+                if search_term in item.search_text:
                     results.append(item)
 
         return results
@@ -6,9 +6,16 @@ Verifies that required package managers are installed
 import subprocess
 import shutil
 import os
+from functools import lru_cache
 from typing import Dict, List, Tuple
 from PyQt6.QtWidgets import QMessageBox, QWidget
 
+@lru_cache(maxsize=None)
+def _command_exists(command: str) -> bool:
+    """Cached PATH lookup shared by all checker instances"""
+    return shutil.which(command) is not None
+
+
 class DependencyChecker:
     def __init__(self, parent_widget: QWidget = None):
         self.parent_widget = parent_widget
@@ -30,7 +37,11 @@ class DependencyChecker:
 
     def check_command_exists(self, command: str) -> bool:
         """Check if a command exists in PATH"""
-        return shutil.which(command) is not None
+        return _command_exists(command)
+
+    def clear_cache(self):
+        """Forget cached lookups so the next check probes PATH again"""
+        _command_exists.cache_clear()
 
     def check_dependencies(self) -> Tuple[Dict[str, bool], Dict[str, bool]]:
         """Check if required and optional dependencies are available"""
@@ -104,6 +115,8 @@ class DependencyChecker:
             elif tool == 'aur_helper':
                 self.show_aur_helper_instructions()
 
+        # Installed tools must be picked up by the next check
+        self.clear_cache()
         return success
 
     def show_aur_helper_instructions(self):
@@ -153,7 +166,8 @@ Note: Only one AUR helper is required!
             # Check if pacman exists (strong indicator)
             return self.check_command_exists('pacman')
 
-        except:
+        except OSError as e:
+            print(f"⚠️ Could not read distribution info: {e}")
             return False
 
     def run_startup_check(self) -> bool:
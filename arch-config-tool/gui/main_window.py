@@ -2,21 +2,33 @@
 Main application window
 """
 import os
+from collections import defaultdict
+from datetime import datetime
+from functools import cached_property
 
 from PyQt6.QtWidgets import (
     QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, QLabel, QPushButton,
     QListWidget, QListWidgetItem, QScrollArea, QLineEdit, QMessageBox,
     QTextEdit, QSplitter, QTabWidget, QTableWidget, QTableWidgetItem,
-    QHeaderView, QProgressBar, QFrame, QStatusBar
+    QHeaderView, QProgressBar, QFrame, QStatusBar, QApplication
 )
 from PyQt6.QtCore import Qt, pyqtSignal, QTimer, QThread, pyqtSignal as Signal
 from PyQt6.QtGui import QFont, QPixmap, QPalette, QColor
 from core.command_executor import CommandExecutor, SafeCommandExecutionThread
+from core.config_manager import ConfigManager
+from core.dependency_check import DependencyChecker
 
 from gui.widgets.category_widget import CategoryWidget
 from gui.widgets.status_widget import StatusWidget
-from gui.widgets.command_output_widget import CommandOutputWidget
+from gui.widgets.command_output_widget import CommandOutputWidget, monospace_font
+from gui.widgets.gradient_frame import GradientFrame
 
+# Execution trace output, off unless ARCH_TOOL_DEBUG is set
+DEBUG = bool(os.environ.get("ARCH_TOOL_DEBUG"))
+
+# History status colors, parsed once instead of per table row
+SUCCESS_COLOR = QColor("#10b981")
+FAILURE_COLOR = QColor("#ef4444")
 
 
 class MainWindow(QMainWindow):
@@ -46,22 +58,16 @@ class MainWindow(QMainWindow):
 
     def init_backend(self):
         """Initialize backend components"""
-        try:
-            from core.config_manager import ConfigManager
-            from core.command_executor import CommandExecutor
-            from core.dependency_check import DependencyChecker
-
-            self.config_manager = ConfigManager()
-            self.command_executor = CommandExecutor()
-            self.dependency_checker = DependencyChecker(self)
+        self.config_manager = ConfigManager()
+        self.command_executor = CommandExecutor()
+        self.dependency_checker = DependencyChecker(self)
 
-            # Connect command executor signals
-            self.command_executor.output_received.connect(self.on_command_output)
-
-        except ImportError as e:
-            self.show_error(f"Backend components failed to load: {e}")
+        # Connect command executor signals
+        self.command_executor.output_received.connect(self.on_command_output)
 
         self.categories = {}
+        self.category_widgets = {}  # category id -> CategoryWidget, built once per category
+        self.tool_category_names = {}  # tool name -> name of the first category listing it
 
     def setup_ui(self):
         """Setup main user interface with improved layout"""
@@ -138,7 +144,7 @@ class MainWindow(QMainWindow):
 
     def create_sidebar_header(self):
         """Create elegant sidebar header"""
-        header = QFrame()
+        header = GradientFrame(GradientFrame.SIDEBAR_GRADIENT, radius=8)
         header.setObjectName("sidebarHeader")
 
         layout = QVBoxLayout()
@@ -193,7 +199,7 @@ class MainWindow(QMainWindow):
             # Simple fallback output widget
             self.output_widget = QTextEdit()
             self.output_widget.setReadOnly(True)
-            self.output_widget.setFont(QFont("Consolas", 10))
+            self.output_widget.setFont(monospace_font(10))
 
         self.output_widget.setMaximumHeight(250)
         self.output_widget.hide()
@@ -314,6 +320,12 @@ class MainWindow(QMainWindow):
 
     def apply_theme(self):
         """Apply unified theme from external stylesheet"""
+        app = QApplication.instance()
+        if app.styleSheet():
+            # main.load_application_theme already installed it application-wide,
+            # a second copy on the window would be parsed and cascaded again
+            return
+
         try:
             # Pfad der aktuellen Python-Datei (main_window.py)
             base_dir = os.path.dirname(os.path.abspath(__file__))
@@ -322,7 +334,7 @@ class MainWindow(QMainWindow):
             css_path = os.path.join(base_dir, "styles", "styles.css")
 
             with open(css_path, "r") as f:
-                self.setStyleSheet(f.read())
+                app.setStyleSheet(f.read())
 
         except Exception as e:
             print(f"Failed to load stylesheet: {e}")
@@ -333,6 +345,8 @@ class MainWindow(QMainWindow):
 
         try:
             self.categories = self.config_manager.get_config()
+            self.reset_category_widgets()
+            self.index_tool_categories()
             self.populate_categories()
 
             # Update status
@@ -379,19 +393,42 @@ class MainWindow(QMainWindow):
         # Clear current content
         self.clear_content_layout()
 
-        # Create category widget
-        category_widget = CategoryWidget(category)
-        category_widget.tool_selected.connect(self.execute_single_tool)
-        category_widget.tools_selected.connect(self.execute_multiple_tools)
+        # Reuse the category widget if it was built before
+        category_widget = self.category_widgets.get(category.id)
+        if category_widget is None:
+            category_widget = CategoryWidget(category)
+            category_widget.tool_selected.connect(self.execute_single_tool)
+            category_widget.tools_selected.connect(self.execute_multiple_tools)
+            self.category_widgets[category.id] = category_widget
 
         self.content_layout.addWidget(category_widget)
+        category_widget.show()
 
     def clear_content_layout(self):
-        """Safely clear content layout"""
+        """Safely clear content layout, cached category widgets are only hidden"""
+        cached = set(self.category_widgets.values())
         while self.content_layout.count():
             child = self.content_layout.takeAt(0)
-            if child.widget():
-                child.widget().deleteLater()
+            widget = child.widget()
+            if widget is None:
+                continue
+            if widget in cached:
+                widget.hide()
+            else:
+                widget.deleteLater()
+
+    def reset_category_widgets(self):
+        """Drop cached category widgets after the configuration changed"""
+        for category_widget in self.category_widgets.values():
+            category_widget.deleteLater()
+        self.category_widgets.clear()
+
+    def index_tool_categories(self):
+        """Map tool names to their category name for grouping search results"""
+        self.tool_category_names = {}
+        for cat in self.categories.values():
+            for tool in cat.items:
+                self.tool_category_names.setdefault(tool.name, cat.name)
 
     def execute_single_tool(self, tool):
         """Execute single tool with confirmation"""
@@ -410,20 +447,24 @@ class MainWindow(QMainWindow):
 
     def execute_multiple_tools(self, tools_list):
         """Execute multiple tools with enhanced progress tracking - FIXED"""
-        print(f"🔧 DEBUG: execute_multiple_tools called with {len(tools_list)} tools")
-        for tool in tools_list:
-            print(f"  - {tool.name}")
+        if DEBUG:
+            print(f"🔧 DEBUG: execute_multiple_tools called with {len(tools_list)} tools")
+            for tool in tools_list:
+                print(f"  - {tool.name}")
 
         if not tools_list:
-            print("❌ DEBUG: No tools provided")
+            if DEBUG:
+                print("❌ DEBUG: No tools provided")
             self.show_warning("No tools selected for execution.")
             return
 
         if not self.confirm_execution(tools_list):
-            print("❌ DEBUG: User cancelled execution")
+            if DEBUG:
+                print("❌ DEBUG: User cancelled execution")
             return
 
-        print("✅ DEBUG: Starting execution...")
+        if DEBUG:
+            print("✅ DEBUG: Starting execution...")
         self.show_output_widget()
 
         # Clear output widget properly
@@ -434,8 +475,6 @@ class MainWindow(QMainWindow):
 
         # Create and start execution thread
         try:
-            from core.command_executor import SafeCommandExecutionThread
-
             self.execution_thread = SafeCommandExecutionThread(tools_list, self.command_executor)
 
             # Connect all signals
@@ -443,11 +482,13 @@ class MainWindow(QMainWindow):
             self.execution_thread.command_finished.connect(self.on_execution_finished)
             self.execution_thread.output_received.connect(self.on_command_output)
 
-            print("✅ DEBUG: Thread created and signals connected")
+            if DEBUG:
+                print("✅ DEBUG: Thread created and signals connected")
 
             # Start thread
             self.execution_thread.start()
-            print("✅ DEBUG: Thread started")
+            if DEBUG:
+                print("✅ DEBUG: Thread started")
 
         except Exception as e:
             print(f"❌ DEBUG: Failed to start execution thread: {e}")
@@ -469,16 +510,22 @@ class MainWindow(QMainWindow):
                 tools_text += f"\n... and {len(tools_list) - 5} more tools"
             info = f"Tools to execute:\n\n{tools_text}"
 
-        msg = QMessageBox(self)
+        msg = self.confirm_dialog
         msg.setWindowTitle(title)
-        msg.setIcon(QMessageBox.Icon.Question)
         msg.setText(text)
         msg.setInformativeText(info)
-        msg.setStandardButtons(QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No)
-        msg.setDefaultButton(QMessageBox.StandardButton.No)
 
         return msg.exec() == QMessageBox.StandardButton.Yes
 
+    @cached_property
+    def confirm_dialog(self):
+        """Execution confirmation dialog, built on first use and reused afterwards"""
+        msg = QMessageBox(self)
+        msg.setIcon(QMessageBox.Icon.Question)
+        msg.setStandardButtons(QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No)
+        msg.setDefaultButton(QMessageBox.StandardButton.No)
+        return msg
+
     def update_execution_progress(self, progress, status):
         """Update execution progress"""
         self.progress_bar.setValue(progress)
@@ -517,8 +564,6 @@ class MainWindow(QMainWindow):
 
     def add_to_history(self, result_data):
         """Add execution result to history"""
-        from datetime import datetime
-
         tool = result_data['tool']
         result = result_data.get('result')
         success = result_data['success']
@@ -552,9 +597,9 @@ class MainWindow(QMainWindow):
             # Status with styling
             status_item = QTableWidgetItem(entry['status'].title())
             if entry['status'] == 'success':
-                status_item.setForeground(QColor("#10b981"))
+                status_item.setForeground(SUCCESS_COLOR)
             else:
-                status_item.setForeground(QColor("#ef4444"))
+                status_item.setForeground(FAILURE_COLOR)
             self.history_table.setItem(row, 3, status_item)
 
             # Exit code
@@ -582,15 +627,10 @@ class MainWindow(QMainWindow):
 
         if results:
             # Group results by category
-            from collections import defaultdict
             grouped_results = defaultdict(list)
 
             for tool in results:
-                category_name = "Unknown"
-                for cat in self.categories.values():
-                    if any(t.name == tool.name for t in cat.items):
-                        category_name = cat.name
-                        break
+                category_name = self.tool_category_names.get(tool.name, "Unknown")
                 grouped_results[category_name].append(tool)
 
             # Display grouped results
@@ -684,6 +724,8 @@ class MainWindow(QMainWindow):
 
         try:
             self.categories = self.config_manager.get_config(force_update=True)
+            self.reset_category_widgets()
+            self.index_tool_categories()
             self.populate_categories()
 
 
@@ -703,6 +745,8 @@ class MainWindow(QMainWindow):
         self.update_status("Running dependency check...", show_progress=True)
 
         try:
+            # Explicit user request - always probe the system again
+            self.dependency_checker.clear_cache()
             success = self.dependency_checker.run_startup_check()
 
             if success:
@@ -751,8 +795,6 @@ class MainWindow(QMainWindow):
                 self.output_widget.ensureCursorVisible()
     def handle_pacman_lock(self):
         """Handle pacman lock in main thread"""
-        from PyQt6.QtWidgets import QMessageBox
-
         reply = QMessageBox.question(
             self,
             "Pacman Database Locked",
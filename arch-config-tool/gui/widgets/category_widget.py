@@ -3,14 +3,75 @@ Category Widget - Production Version
 Clean, modern design without debug output
 """
 
-import os
+from functools import cached_property, lru_cache
 from PyQt6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QLabel, QPushButton,
     QCheckBox, QScrollArea, QFrame, QMessageBox, QGridLayout,
     QButtonGroup
 )
-from PyQt6.QtCore import Qt, pyqtSignal, QPropertyAnimation, QEasingCurve
-from PyQt6.QtGui import QFont, QColor
+from PyQt6.QtCore import Qt, pyqtSignal, QSize, QTimer, QRectF
+from PyQt6.QtGui import QFont, QColor, QPainter, QPen, QFontMetrics
+
+from .gradient_frame import GradientFrame
+
+# Up to two grid rows are shown without a nested scroll area. Two rows of
+# cards fit the content area at the default window size; larger categories
+# keep the scroll area, whose scroll bar drives the lazy card batches.
+MAX_UNSCROLLED_TOOLS = 4
+
+# Cards built up front, further cards are created as the list is scrolled
+CARD_BATCH_SIZE = 8
+SELECTION_UI_DELAY_MS = 16  # selection summary refreshes at most once per frame
+VIEW_SWITCH_DELAY_MS = 50  # rapid grid/list toggles are laid out only once
+
+# Tag chips, painted in ToolCard.paintEvent instead of label widgets
+TAG_BACKGROUND = QColor("#ddd6fe")
+TAG_BORDER = QPen(QColor("#c4b5fd"), 1)
+TAG_TEXT = QColor("#5b21b6")
+MORE_TAGS_TEXT = QColor("#9ca3af")
+TAG_RADIUS = 6
+TAG_PADDING = 4
+TAG_SPACING = 6
+TAG_ROW = 3  # footer row of the card grid
+
+@lru_cache(maxsize=None)
+def tag_font():
+    """Shared bold tag font (created on first paint, after QApplication exists)"""
+    font = QFont()
+    font.setPixelSize(8)
+    font.setBold(True)
+    return font
+
+@lru_cache(maxsize=None)
+def tag_metrics():
+    """Font metrics for tag chips, shared by all cards"""
+    return QFontMetrics(tag_font())
+
+@lru_cache(maxsize=None)
+def tag_text_width(text):
+    """Measured width of a chip text, tags repeat across many tools"""
+    return tag_metrics().horizontalAdvance(text)
+
+# Card frame, painted in ToolCard.paintEvent instead of QSS border/background rules
+CARD_BACKGROUND = QColor("#ffffff")
+CARD_HOVER_BACKGROUND = QColor("#fafbff")
+CARD_SELECTED_BACKGROUND = QColor("#eef2ff")
+CARD_BORDER = QPen(QColor("#e5e7eb"), 2)
+CARD_ACCENT_BORDER = QPen(QColor("#4f46e5"), 2)
+CARD_SELECTED_BORDER = QPen(QColor("#4f46e5"), 3)
+CARD_RADIUS = 8
+CARD_MARGIN = 3
+
+class CardLabel(QLabel):
+    """Word-wrapped label for fixed-size cards, laid out without height-for-width"""
+
+    def __init__(self, text=""):
+        super().__init__(text)
+        self.setWordWrap(True)
+
+    def hasHeightForWidth(self):
+        """Card height is fixed, so skip re-flowing the text on every layout pass"""
+        return False
 
 class ToolCard(QWidget):
     """Modern tool card with clean design"""
@@ -18,145 +79,183 @@ class ToolCard(QWidget):
     tool_selected = pyqtSignal(object)
     selection_changed = pyqtSignal(object, bool)
 
+    CARD_HEIGHT = 140
+    CARD_MIN_WIDTH = 300
+
     def __init__(self, tool):
         super().__init__()
         self.tool = tool
         self.is_selected = False
         self.is_hovered = False
         self.setup_ui()
-        self.setup_animations()
 
     def setup_ui(self):
         """Setup tool card UI with modern design"""
-        self.setFixedHeight(140)
-        self.setMinimumWidth(300)
+        self.setFixedHeight(self.CARD_HEIGHT)
+        self.setMinimumWidth(self.CARD_MIN_WIDTH)
         self.setObjectName("toolCard")
         self.setCursor(Qt.CursorShape.PointingHandCursor)
 
-        layout = QVBoxLayout()
+        # One grid for the whole card: header row, description, command, footer
+        layout = QGridLayout()
         layout.setContentsMargins(16, 14, 16, 14)
-        layout.setSpacing(10)
-
-        # Header with checkbox and tool name
-        header_layout = QHBoxLayout()
-        header_layout.setSpacing(12)
+        layout.setHorizontalSpacing(12)
+        layout.setVerticalSpacing(10)
+        layout.setColumnStretch(1, 1)
 
         # Selection checkbox
         self.checkbox = QCheckBox()
         self.checkbox.setObjectName("toolCheckbox")
-        self.checkbox.stateChanged.connect(self.on_selection_changed)
-        header_layout.addWidget(self.checkbox)
+        self.checkbox.toggled.connect(self.on_selection_changed)
+        layout.addWidget(self.checkbox, 0, 0)
 
         # Tool name
-        self.title_label = QLabel(self.tool.name)
+        self.title_label = CardLabel(self.tool.name)
         self.title_label.setObjectName("toolTitle")
-        self.title_label.setWordWrap(True)
-        header_layout.addWidget(self.title_label, 1)
+        layout.addWidget(self.title_label, 0, 1)
 
         # Execute button
         self.exec_btn = QPushButton("▶")
         self.exec_btn.setObjectName("executeButton")
         self.exec_btn.setFixedSize(32, 32)
         self.exec_btn.setToolTip("Execute this tool")
-        self.exec_btn.clicked.connect(lambda: self.tool_selected.emit(self.tool))
-        header_layout.addWidget(self.exec_btn)
-
-        layout.addLayout(header_layout)
+        self.exec_btn.clicked.connect(self.on_execute_clicked)
+        layout.addWidget(self.exec_btn, 0, 2, Qt.AlignmentFlag.AlignRight)
 
         # Description
-        self.desc_label = QLabel(self.tool.description)
+        self.desc_label = CardLabel(self.tool.description)
         self.desc_label.setObjectName("toolDescription")
-        self.desc_label.setWordWrap(True)
         self.desc_label.setMaximumHeight(40)
-        layout.addWidget(self.desc_label)
+        layout.addWidget(self.desc_label, 1, 0, 1, 3)
 
-        # Command preview
-        cmd_preview = self.tool.command
-        if len(cmd_preview) > 70:
-            cmd_preview = cmd_preview[:67] + "..."
-
-        self.cmd_label = QLabel(f"{cmd_preview}")
+        # Command preview (truncated once on the model)
+        self.cmd_label = QLabel(self.tool.cmd_preview)
         self.cmd_label.setObjectName("commandPreview")
-        layout.addWidget(self.cmd_label)
-
-        # Tags and category info
-        footer_layout = QHBoxLayout()
-        footer_layout.setSpacing(6)
-
-        # Tags (show max 3)
-        if hasattr(self.tool, 'tags') and self.tool.tags:
-            tags_to_show = self.tool.tags[:3]
-            for tag in tags_to_show:
-                tag_label = QLabel(f"#{tag}")
-                tag_label.setObjectName("toolTag")
-                footer_layout.addWidget(tag_label)
+        layout.addWidget(self.cmd_label, 2, 0, 1, 3)
 
-            if len(self.tool.tags) > 3:
-                more_label = QLabel(f"+{len(self.tool.tags) - 3}")
-                more_label.setObjectName("moreTagsLabel")
-                footer_layout.addWidget(more_label)
-
-        footer_layout.addStretch()
+        # Tags (show max 3) are painted as chips, only their row height is reserved
+        # ConfigItem guarantees tags/visible_tags are lists and category a string
+        if self.tag_chips:
+            layout.setRowMinimumHeight(TAG_ROW, int(self.tag_chips[0][0].height()))
 
         # Category indicator
-        if hasattr(self.tool, 'category'):
-            category_label = QLabel(f"📂 {self.tool.category}")
+        if self.tool.category_text:
+            category_label = QLabel(self.tool.category_text)
             category_label.setObjectName("categoryLabel")
-            footer_layout.addWidget(category_label)
+            layout.addWidget(category_label, TAG_ROW, 2, Qt.AlignmentFlag.AlignRight)
 
-        layout.addLayout(footer_layout)
         self.setLayout(layout)
 
-        # Apply styling
-        self.apply_card_styling()
+    @cached_property
+    def tag_chips(self):
+        """Measure tag chips once: (rect relative to the footer row, text, is_chip)"""
+        height = tag_metrics().height() + 2
+        chips = []
+        x = 0
+        for tag in self.tool.visible_tags:
+            text = f"#{tag}"
+            width = tag_text_width(text) + 2 * TAG_PADDING
+            chips.append((QRectF(x, 0, width, height), text, True))
+            x += width + TAG_SPACING
+
+        if chips and self.tool.extra_tag_count:
+            text = f"+{self.tool.extra_tag_count}"
+            chips.append((QRectF(x, 0, tag_text_width(text), height), text, False))
+        return chips
+
+    def on_execute_clicked(self):
+        """Emit this card's tool for single execution"""
+        self.tool_selected.emit(self.tool)
+
+    def on_selection_changed(self, checked):
+        """Handle selection state change"""
+        self.apply_selection_state(checked)
+        self.selection_changed.emit(self.tool, checked)
 
-    def setup_animations(self):
-        """Setup hover animations"""
-        self.animation = QPropertyAnimation(self, b"geometry")
-        self.animation.setDuration(150)
-        self.animation.setEasingCurve(QEasingCurve.Type.OutCubic)
+    def apply_selection_state(self, selected):
+        """Update selection flag and highlight"""
+        if selected != self.is_selected:
+            self.is_selected = selected
+            # Only the card frame changes, no style re-resolution needed
+            self.update()
 
-    def apply_card_styling(self):
-        """Apply unified theme from external stylesheet"""
-        try:
-            base_dir = os.path.dirname(os.path.abspath(__file__))
-            css_path = os.path.join(base_dir, "styles", "styles.css")
+    def set_selected(self, selected):
+        """Programmatically set selection state"""
+        self.checkbox.setChecked(selected)
+
+    def set_selected_silent(self, selected):
+        """Set selection state without emitting selection_changed (bulk updates)"""
+        self.checkbox.blockSignals(True)
+        self.checkbox.setChecked(selected)
+        self.checkbox.blockSignals(False)
+        self.apply_selection_state(selected)
 
-            with open(css_path, "r") as f:
-                self.setStyleSheet(f.read())
-        except Exception:
-            # Fallback styling if stylesheet not found
-            pass
+    def hasHeightForWidth(self):
+        """Cards have a fixed height, skip word-wrap height-for-width queries"""
+        return False
 
-    def on_selection_changed(self, state):
-        """Handle selection state change"""
-        self.is_selected = state == Qt.CheckState.Checked.value
+    def sizeHint(self):
+        """Uniform size hint, no layout walk over the card contents"""
+        return QSize(self.CARD_MIN_WIDTH, self.CARD_HEIGHT)
 
+    def paintEvent(self, event):
+        """Paint the rounded card frame for the current selection/hover state"""
         if self.is_selected:
-            self.setStyleSheet(self.styleSheet() + """
-                QWidget#toolCard {
-                    border-color: #4f46e5 !important;
-                    background-color: #eef2ff !important;
-                    border-width: 3px !important;
-                }
-            """)
+            background, border = CARD_SELECTED_BACKGROUND, CARD_SELECTED_BORDER
+        elif self.is_hovered:
+            background, border = CARD_HOVER_BACKGROUND, CARD_ACCENT_BORDER
         else:
-            self.apply_card_styling()
-
-        self.selection_changed.emit(self.tool, self.is_selected)
+            background, border = CARD_BACKGROUND, CARD_BORDER
+
+        # Keep the whole pen inside the card margin
+        inset = CARD_MARGIN + border.widthF() / 2
+        rect = QRectF(self.rect()).adjusted(inset, inset, -inset, -inset)
+
+        painter = QPainter(self)
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        painter.setPen(border)
+        painter.setBrush(background)
+        painter.drawRoundedRect(rect, CARD_RADIUS, CARD_RADIUS)
+
+        if self.tag_chips:
+            self.paint_tag_chips(painter)
+        painter.end()
+
+    def paint_tag_chips(self, painter):
+        """Draw the tag chips into the footer row, left of the category label"""
+        layout = self.layout()
+        footer = QRectF(layout.cellRect(TAG_ROW, 0)).united(QRectF(layout.cellRect(TAG_ROW, 1)))
+        top = footer.center().y() - self.tag_chips[0][0].height() / 2
+
+        painter.setClipRect(footer)
+        painter.setFont(tag_font())
+        for rect, text, is_chip in self.tag_chips:
+            chip = rect.translated(footer.left(), top)
+            if is_chip:
+                painter.setPen(TAG_BORDER)
+                painter.setBrush(TAG_BACKGROUND)
+                painter.drawRoundedRect(chip, TAG_RADIUS, TAG_RADIUS)
+                painter.setPen(TAG_TEXT)
+            else:
+                painter.setPen(MORE_TAGS_TEXT)
+            painter.drawText(chip, Qt.AlignmentFlag.AlignCenter, text)
 
-    def set_selected(self, selected):
-        """Programmatically set selection state"""
-        self.checkbox.setChecked(selected)
+    def set_hovered(self, hovered):
+        """Update hover flag, repaint only if the frame actually looks different"""
+        if hovered != self.is_hovered:
+            self.is_hovered = hovered
+            # A selected card is drawn the same with or without hover
+            if not self.is_selected:
+                self.update()
 
     def enterEvent(self, event):
         """Mouse enter event"""
-        self.is_hovered = True
+        self.set_hovered(True)
         super().enterEvent(event)
 
     def leaveEvent(self, event):
         """Mouse leave event"""
-        self.is_hovered = False
+        self.set_hovered(False)
         super().leaveEvent(event)
 
 class CategoryWidget(QWidget):
@@ -168,10 +267,31 @@ class CategoryWidget(QWidget):
     def __init__(self, category):
         super().__init__()
         self.category = category
-        self.selected_tools = {}
+        self.selected_ids = set()  # id() of selected tools, order comes from category.items
         self.tool_cards = []
+        self.scroll_area = None
+        self.cards_built = False  # cards are created on first show
+        self.last_selection_count = -1  # count the selection UI was last rendered for
         self.view_mode = "grid"  # grid or list
+        self.total_tools = len(category.items)  # items are fixed for the widget's lifetime
+        self.single_tool = self.total_tools == 1  # no bulk controls needed
         self.setup_ui()
+        self.setup_selection_timer()
+        self.setup_view_timer()
+
+    def setup_selection_timer(self):
+        """Coalesce per-card toggles into one summary update per frame"""
+        self.selection_ui_timer = QTimer(self)
+        self.selection_ui_timer.setSingleShot(True)
+        self.selection_ui_timer.setInterval(SELECTION_UI_DELAY_MS)
+        self.selection_ui_timer.timeout.connect(self.update_selection_ui)
+
+    def setup_view_timer(self):
+        """Debounce view mode switches into a single relayout"""
+        self.view_timer = QTimer(self)
+        self.view_timer.setSingleShot(True)
+        self.view_timer.setInterval(VIEW_SWITCH_DELAY_MS)
+        self.view_timer.timeout.connect(self.relayout_cards)
 
     def setup_ui(self):
         """Setup category widget UI"""
@@ -183,9 +303,10 @@ class CategoryWidget(QWidget):
         header = self.create_category_header()
         layout.addWidget(header)
 
-        # Control panel
-        controls = self.create_enhanced_control_panel()
-        layout.addWidget(controls)
+        # Control panel - a single tool is executed from its own card
+        if not self.single_tool:
+            controls = self.create_enhanced_control_panel()
+            layout.addWidget(controls)
 
         # Tools area
         tools_area = self.create_tools_area()
@@ -195,7 +316,7 @@ class CategoryWidget(QWidget):
 
     def create_category_header(self):
         """Create elegant category header"""
-        header = QFrame()
+        header = GradientFrame(GradientFrame.CATEGORY_GRADIENT, radius=12)
         header.setObjectName("categoryHeader")
 
         layout = QVBoxLayout()
@@ -213,7 +334,7 @@ class CategoryWidget(QWidget):
         title_layout.addStretch()
 
         # Tools count badge
-        count_badge = QLabel(f"{len(self.category.items)} tools")
+        count_badge = QLabel(f"{self.total_tools} tools")
         count_badge.setObjectName("countBadge")
         title_layout.addWidget(count_badge)
 
@@ -311,12 +432,14 @@ class CategoryWidget(QWidget):
 
         # Grid view button
         self.grid_btn = QPushButton("⊞ Grid")
+        self.grid_btn.setObjectName("gridButton")
         self.grid_btn.setCheckable(True)
         self.grid_btn.setChecked(True)
         self.grid_btn.clicked.connect(lambda: self.set_view_mode("grid"))
 
         # List view button
         self.list_btn = QPushButton("☰ List")
+        self.list_btn.setObjectName("listButton")
         self.list_btn.setCheckable(True)
         self.list_btn.clicked.connect(lambda: self.set_view_mode("list"))
 
@@ -325,30 +448,6 @@ class CategoryWidget(QWidget):
         self.view_button_group.addButton(self.grid_btn)
         self.view_button_group.addButton(self.list_btn)
 
-        # Styling
-        toggle_style = """
-            QPushButton {
-                border: 1px solid #d1d5db;
-                padding: 6px 12px;
-                font-size: 11px;
-                font-weight: 600;
-                min-width: 60px;
-            }
-
-            QPushButton:hover {
-                background-color: #f9fafb;
-            }
-
-            QPushButton:checked {
-                background-color: #4f46e5;
-                color: white;
-                border-color: #4f46e5;
-            }
-        """
-
-        self.grid_btn.setStyleSheet(toggle_style + "border-radius: 6px 0px 0px 6px;")
-        self.list_btn.setStyleSheet(toggle_style + "border-radius: 0px 6px 6px 0px;")
-
         layout.addWidget(self.grid_btn)
         layout.addWidget(self.list_btn)
 
@@ -356,11 +455,7 @@ class CategoryWidget(QWidget):
         return toggle_group
 
     def create_tools_area(self):
-        """Create scrollable tools area"""
-        scroll_area = QScrollArea()
-        scroll_area.setWidgetResizable(True)
-        scroll_area.setObjectName("toolsScrollArea")
-
+        """Create tools area, scrollable only when the category is large"""
         # Tools container
         self.tools_container = QWidget()
         self.tools_container.setObjectName("toolsContainer")
@@ -370,42 +465,107 @@ class CategoryWidget(QWidget):
         self.tools_layout.setSpacing(12)
         self.tools_layout.setContentsMargins(16, 16, 16, 16)
 
-        # Add tool cards
-        self.populate_tools()
-
+        # Tool cards are added in showEvent, a category that is never shown builds none
         self.tools_container.setLayout(self.tools_layout)
+
+        # Small categories fit as they are - the content area already scrolls
+        needs_scroll = self.total_tools > MAX_UNSCROLLED_TOOLS
+        if not needs_scroll:
+            return self.tools_container
+
+        scroll_area = QScrollArea()
+        scroll_area.setWidgetResizable(True)
+        scroll_area.setObjectName("toolsScrollArea")
         scroll_area.setWidget(self.tools_container)
 
+        # Remaining cards are built once the end of the list comes into view
+        self.scroll_area = scroll_area
+        scroll_bar = scroll_area.verticalScrollBar()
+        scroll_bar.valueChanged.connect(self.on_tools_scrolled)
+        scroll_bar.rangeChanged.connect(self.on_tools_scrolled)
+
         return scroll_area
 
+    def showEvent(self, event):
+        """Build the tool cards the first time the category is shown"""
+        if not self.cards_built:
+            self.cards_built = True
+            self.populate_tools()
+        super().showEvent(event)
+
     def populate_tools(self):
-        """Populate tools based on current view mode"""
-        # Clear existing cards
-        for card in self.tool_cards:
-            card.setParent(None)
-        self.tool_cards.clear()
-
-        # Create new cards
-        for i, tool in enumerate(self.category.items):
-            tool_card = ToolCard(tool)
-            tool_card.selection_changed.connect(self.on_tool_selection_changed)
-            tool_card.tool_selected.connect(self.tool_selected.emit)
-
-            self.tool_cards.append(tool_card)
-
-            # Add to layout based on view mode
-            if self.view_mode == "grid":
-                row = i // 2  # 2 columns
-                col = i % 2
-                self.tools_layout.addWidget(tool_card, row, col)
-            else:  # list mode
-                self.tools_layout.addWidget(tool_card, i, 0, 1, 2)
-
-        # Add stretch at the end
+        """Build the initial cards, runs once from the first showEvent"""
+        # View switches move the existing cards, so there are no old cards to clear.
+        # Create the first batch of cards, the rest follows on scroll
+        self.materialize_cards(CARD_BATCH_SIZE)
+        self.schedule_fill_check()
+
+        self.apply_row_stretch()
+
+    def apply_row_stretch(self):
+        """Put the trailing stretch below the last row of the current view mode"""
+        grid_row, list_row = self.total_tools // 2 + 1, self.total_tools
+        active, inactive = (grid_row, list_row) if self.view_mode == "grid" else (list_row, grid_row)
+        # Clear first: for 1-2 tools both modes share the same stretch row
+        self.tools_layout.setRowStretch(inactive, 0)
+        self.tools_layout.setRowStretch(active, 1)
+
+    def materialize_cards(self, count):
+        """Create up to count more tool cards"""
+        start = len(self.tool_cards)
+
+        # Add the whole batch with painting and layout frozen, then lay out once
+        self.tools_container.setUpdatesEnabled(False)
+        self.tools_layout.setEnabled(False)
+        for i, tool in enumerate(self.category.items[start:start + count], start):
+            self.add_tool_card(i, tool)
+        self.tools_layout.setEnabled(True)
+        self.tools_layout.invalidate()
+        self.tools_container.setUpdatesEnabled(True)
+
+    def add_tool_card(self, i, tool):
+        """Create the card for tool i and place it according to the view mode"""
+        tool_card = ToolCard(tool)
+        if self.single_tool:
+            # No control panel acts on the selection, the card runs via its own button
+            tool_card.checkbox.hide()
+        if id(tool) in self.selected_ids:
+            tool_card.set_selected_silent(True)
+        tool_card.selection_changed.connect(self.on_tool_selection_changed)
+        tool_card.tool_selected.connect(self.tool_selected)
+
+        self.tool_cards.append(tool_card)
+        self.place_card(i, tool_card)
+        # Show right away instead of via Qt's queued show, so the layout counts it now
+        tool_card.show()
+
+    def place_card(self, i, tool_card):
+        """Put card i into the grid cell for the current view mode"""
         if self.view_mode == "grid":
-            self.tools_layout.setRowStretch(len(self.category.items) // 2 + 1, 1)
-        else:
-            self.tools_layout.setRowStretch(len(self.category.items), 1)
+            row = i // 2  # 2 columns
+            col = i % 2
+            self.tools_layout.addWidget(tool_card, row, col)
+        else:  # list mode
+            self.tools_layout.addWidget(tool_card, i, 0, 1, 2)
+
+    def on_tools_scrolled(self, *args):
+        """Build the next batch of cards when the end of the list is near"""
+        if not self.cards_built or len(self.tool_cards) >= self.total_tools:
+            return
+
+        # Measure the laid out content directly, the scroll range lags behind new batches
+        scroll_bar = self.scroll_area.verticalScrollBar()
+        viewport_height = self.scroll_area.viewport().height()
+        below_view = self.tools_layout.sizeHint().height() - scroll_bar.value() - viewport_height
+        if below_view <= viewport_height:
+            self.materialize_cards(CARD_BATCH_SIZE)
+            self.schedule_fill_check()
+
+    def schedule_fill_check(self):
+        """Re-check after the new batch is laid out, so batches keep coming until the viewport is filled"""
+        # Without a scroll range neither valueChanged nor rangeChanged would fire again
+        if self.scroll_area is not None and len(self.tool_cards) < self.total_tools:
+            QTimer.singleShot(0, self.on_tools_scrolled)
 
     def set_view_mode(self, mode):
         """Set view mode (grid or list)"""
@@ -418,22 +578,44 @@ class CategoryWidget(QWidget):
         self.grid_btn.setChecked(mode == "grid")
         self.list_btn.setChecked(mode == "list")
 
-        # Recreate layout
-        self.populate_tools()
+        # Rapid toggles restart the timer, the cards are moved once it fires
+        self.view_timer.start()
+
+    def relayout_cards(self):
+        """Move the existing cards to their cells for the current view mode"""
+        self.tools_container.setUpdatesEnabled(False)
+        for card in self.tool_cards:
+            self.tools_layout.removeWidget(card)
+        for i, card in enumerate(self.tool_cards):
+            self.place_card(i, card)
+        self.apply_row_stretch()
+        self.tools_container.setUpdatesEnabled(True)
 
     def on_tool_selection_changed(self, tool, selected):
         """Handle tool selection change"""
         if selected:
-            self.selected_tools[tool.name] = tool
+            self.selected_ids.add(id(tool))
         else:
-            self.selected_tools.pop(tool.name, None)
+            self.selected_ids.discard(id(tool))
 
-        self.update_selection_ui()
+        if not self.selection_ui_timer.isActive():
+            self.selection_ui_timer.start()
 
     def update_selection_ui(self):
         """Update selection-related UI elements"""
-        count = len(self.selected_tools)
-        total = len(self.category.items)
+        if self.single_tool:
+            return
+        count = len(self.selected_ids)
+        if count == self.last_selection_count:
+            return
+        # Restyle only when crossing between empty and non-empty selection
+        has_selection = count > 0
+        if has_selection != (self.last_selection_count > 0):
+            self.stats_label.setProperty("active", has_selection)
+            self.stats_label.style().polish(self.stats_label)
+            self.execute_btn.setEnabled(has_selection)
+        self.last_selection_count = count
+        total = self.total_tools
 
         # Update stats label
         if count == 0:
@@ -443,9 +625,8 @@ class CategoryWidget(QWidget):
         else:
             self.stats_label.setText(f"{count} of {total} tools selected")
 
-        # Update execute button
-        self.execute_btn.setEnabled(count > 0)
-        if count > 0:
+        # Update execute button text
+        if has_selection:
             if count == 1:
                 self.execute_btn.setText("🚀 Execute 1 Tool")
             else:
@@ -454,34 +635,58 @@ class CategoryWidget(QWidget):
             self.execute_btn.setText("🚀 Execute Selected Tools")
 
     def select_all_tools(self):
-        """Select all tools"""
-        for card in self.tool_cards:
-            card.set_selected(True)
+        """Select all tools, including those without a card yet"""
+        self.selected_ids.update(id(tool) for tool in self.category.items)
+
+        # Cards are updated silently, the summary is refreshed once at the end
+        self.set_cards_selected_silent(True)
+        self.update_selection_ui()
 
     def select_no_tools(self):
         """Deselect all tools"""
-        for card in self.tool_cards:
-            card.set_selected(False)
+        self.selected_ids.clear()
+
+        self.set_cards_selected_silent(False)
+        self.update_selection_ui()
+
+    def set_cards_selected_silent(self, selected):
+        """Restyle all built cards with painting frozen, then repaint once"""
+        # The scroll viewport is what actually paints the cards
+        surface = self.scroll_area.viewport() if self.scroll_area else self.tools_container
+        surface.setUpdatesEnabled(False)
+        try:
+            for card in self.tool_cards:
+                card.set_selected_silent(selected)
+        finally:
+            surface.setUpdatesEnabled(True)
+            surface.update()
 
     def execute_selected_tools(self):
         """Execute selected tools with confirmation"""
-        if not self.selected_tools:
+        if not self.selected_ids:
             self.show_no_selection_message()
             return
 
-        selected_list = list(self.selected_tools.values())
+        selected_list = self.get_selected_tools()
 
         # Confirmation dialog
-        reply = QMessageBox.question(
-            self,
-            "Confirm Execution",
-            f"Execute {len(selected_list)} selected tools?\n\nThis will run system commands with sudo privileges.",
-            QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No,
-            QMessageBox.StandardButton.No
-        )
+        self.confirm_dialog.setText(f"Execute {len(selected_list)} selected tools?")
+        reply = self.confirm_dialog.exec()
 
         if reply == QMessageBox.StandardButton.Yes:
-            self.tools_selected.emit(selected_list)
+            # Let the dialog close and repaint before receivers start execution
+            QTimer.singleShot(0, lambda: self.tools_selected.emit(selected_list))
+
+    @cached_property
+    def confirm_dialog(self):
+        """Confirmation dialog, built on first use and reused afterwards"""
+        msg = QMessageBox(self)
+        msg.setIcon(QMessageBox.Icon.Question)
+        msg.setWindowTitle("Confirm Execution")
+        msg.setInformativeText("This will run system commands with sudo privileges.")
+        msg.setStandardButtons(QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No)
+        msg.setDefaultButton(QMessageBox.StandardButton.No)
+        return msg
 
     def show_no_selection_message(self):
         """Show message when no tools are selected"""
@@ -492,8 +697,8 @@ class CategoryWidget(QWidget):
         msg.exec()
 
     def get_selected_tools(self):
-        """Get list of selected tools"""
-        return list(self.selected_tools.values())
+        """Get list of selected tools in category order"""
+        return [tool for tool in self.category.items if id(tool) in self.selected_ids]
 
     def clear_selection(self):
         """Clear all selections"""
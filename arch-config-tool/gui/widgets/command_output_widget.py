@@ -4,11 +4,34 @@ Command Output Widget - Shows real-time command execution output
 
 from PyQt6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QLabel, QPushButton,
-    QTextEdit, QFrame, QScrollBar, QTabWidget, QSplitter
+    QPlainTextEdit, QFrame, QScrollBar, QTabWidget, QSplitter
 )
 from PyQt6.QtCore import Qt, QTimer, pyqtSignal
 from PyQt6.QtGui import QFont, QTextCursor, QColor, QTextCharFormat
 from datetime import datetime
+from functools import lru_cache
+
+# Text colors by output type / log level (stderr and error share one entry)
+OUTPUT_COLORS = {
+    "stdout": "#4fc3f7",  # Light blue
+    "stderr": "#f48fb1",  # Light red
+}
+LOG_LEVEL_COLORS = {
+    "info": OUTPUT_COLORS["stdout"],
+    "warning": "#ffb74d",
+    "error": OUTPUT_COLORS["stderr"],
+}
+DEFAULT_TEXT_COLOR = "#ffffff"  # White
+
+@lru_cache(maxsize=None)
+def monospace_font(size: int = 10) -> QFont:
+    """Shared monospace font (QFont is implicitly shared, one lookup per size)"""
+    return QFont("Consolas", size)
+
+@lru_cache(maxsize=None)
+def cached_qcolor(name: str) -> QColor:
+    """Parse a color string once and reuse the QColor afterwards"""
+    return QColor(name)
 
 class CommandOutputWidget(QWidget):
     """Enhanced command output widget with tabs and filtering"""
@@ -19,6 +42,7 @@ class CommandOutputWidget(QWidget):
         self.max_lines = 1000
         self.auto_scroll = True
         self.setup_ui()
+        self.setup_counter_timer()
 
     def setup_ui(self):
         """Setup command output UI"""
@@ -36,17 +60,17 @@ class CommandOutputWidget(QWidget):
 
         self.setLayout(layout)
 
+    def setup_counter_timer(self):
+        """Throttle tab counter updates to ~30 per second"""
+        self.counter_timer = QTimer(self)
+        self.counter_timer.setSingleShot(True)
+        self.counter_timer.setInterval(33)
+        self.counter_timer.timeout.connect(self.update_tab_counters)
+
     def create_header(self):
         """Create output widget header"""
         header = QFrame()
         header.setObjectName("outputHeader")
-        header.setStyleSheet("""
-            QFrame#outputHeader {
-                background-color: #f8f9fa;
-                border-bottom: 1px solid #dee2e6;
-                padding: 8px 16px;
-            }
-        """)
 
         layout = QHBoxLayout()
         layout.setContentsMargins(0, 0, 0, 0)
@@ -54,7 +78,7 @@ class CommandOutputWidget(QWidget):
 
         # Title
         title = QLabel("📟 Command Output")
-        title.setStyleSheet("font-size: 14px; font-weight: 600; color: #495057;")
+        title.setObjectName("outputTitle")
         layout.addWidget(title)
 
         layout.addStretch()
@@ -99,56 +123,16 @@ class CommandOutputWidget(QWidget):
         self.stderr_output = self.create_output_text_edit("stderr")
         self.tab_widget.addTab(self.stderr_output, "❌ Errors")
 
-        # Apply tab styling
-        self.tab_widget.setStyleSheet("""
-            QTabWidget#outputTabs::pane {
-                border: none;
-                background-color: #1e1e1e;
-            }
-
-            QTabWidget#outputTabs QTabBar::tab {
-                background-color: #2d2d2d;
-                color: #ffffff;
-                border: none;
-                padding: 8px 16px;
-                margin-right: 2px;
-                border-top-left-radius: 4px;
-                border-top-right-radius: 4px;
-                font-size: 12px;
-                font-weight: 600;
-            }
-
-            QTabWidget#outputTabs QTabBar::tab:selected {
-                background-color: #1e1e1e;
-                color: #4fc3f7;
-            }
-
-            QTabWidget#outputTabs QTabBar::tab:hover:!selected {
-                background-color: #404040;
-            }
-        """)
-
         return self.tab_widget
 
     def create_output_text_edit(self, output_type):
         """Create styled text edit for output"""
-        text_edit = QTextEdit()
+        # Plain text edit: no rich-text document machinery for append-only logs
+        text_edit = QPlainTextEdit()
         text_edit.setObjectName(f"output_{output_type}")
         text_edit.setReadOnly(True)
-        text_edit.setFont(QFont("Consolas", 10))
-
-        # Terminal-like styling
-        text_edit.setStyleSheet(f"""
-            QTextEdit#output_{output_type} {{
-                background-color: #1e1e1e;
-                color: #ffffff;
-                border: none;
-                padding: 8px;
-                font-family: 'Consolas', 'Monaco', 'Courier New', monospace;
-                font-size: 11px;
-                line-height: 1.4;
-            }}
-        """)
+        text_edit.setMaximumBlockCount(self.max_lines)
+        text_edit.setFont(monospace_font(10))
 
         return text_edit
 
@@ -160,15 +144,9 @@ class CommandOutputWidget(QWidget):
         timestamp = datetime.now().strftime("%H:%M:%S")
 
         # Format output line
-        if output_type == "stdout":
-            formatted_line = f"[{timestamp}] {text}"
-            color = "#4fc3f7"  # Light blue
-        elif output_type == "stderr":
-            formatted_line = f"[{timestamp}] ERROR: {text}"
-            color = "#f48fb1"  # Light red
-        else:
-            formatted_line = f"[{timestamp}] {text}"
-            color = "#ffffff"  # White
+        prefix = "ERROR: " if output_type == "stderr" else ""
+        formatted_line = f"[{timestamp}] {prefix}{text}"
+        color = OUTPUT_COLORS.get(output_type, DEFAULT_TEXT_COLOR)
 
         # Add to combined output
         self.append_to_text_edit(self.combined_output, formatted_line, color)
@@ -191,8 +169,9 @@ class CommandOutputWidget(QWidget):
         if len(self.output_buffer) > self.max_lines:
             self.output_buffer = self.output_buffer[-self.max_lines:]
 
-        # Update tab titles with counters
-        self.update_tab_counters()
+        # Update tab titles with counters (throttled, bursts share one update)
+        if not self.counter_timer.isActive():
+            self.counter_timer.start()
 
     def append_to_text_edit(self, text_edit, text, color):
         """Append formatted text to text edit"""
@@ -201,7 +180,7 @@ class CommandOutputWidget(QWidget):
 
         # Set text color
         format = QTextCharFormat()
-        format.setForeground(QColor(color))
+        format.setForeground(cached_qcolor(color))
         cursor.setCharFormat(format)
 
         # Insert text
@@ -241,6 +220,7 @@ class CommandOutputWidget(QWidget):
 
     def clear(self):
         """Clear all output"""
+        self.counter_timer.stop()
         self.combined_output.clear()
         self.stdout_output.clear()
         self.stderr_output.clear()
@@ -296,46 +276,24 @@ class CompactOutputWidget(QWidget):
         header_layout.setSpacing(8)
 
         title = QLabel("📟 Output")
-        title.setStyleSheet("font-size: 12px; font-weight: 600; color: #495057;")
+        title.setObjectName("compactOutputTitle")
         header_layout.addWidget(title)
 
         header_layout.addStretch()
 
         clear_btn = QPushButton("Clear")
         clear_btn.setFixedSize(60, 24)
-        clear_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #6c757d;
-                color: white;
-                border: none;
-                border-radius: 4px;
-                font-size: 11px;
-                font-weight: 600;
-            }
-            QPushButton:hover {
-                background-color: #5a6268;
-            }
-        """)
+        clear_btn.setObjectName("compactClearButton")
         clear_btn.clicked.connect(self.clear)
         header_layout.addWidget(clear_btn)
 
         layout.addLayout(header_layout)
 
         # Output area
-        self.output_area = QTextEdit()
+        self.output_area = QPlainTextEdit()
         self.output_area.setReadOnly(True)
-        self.output_area.setFont(QFont("Consolas", 9))
-        self.output_area.setStyleSheet("""
-            QTextEdit {
-                background-color: #1e1e1e;
-                color: #ffffff;
-                border: 1px solid #404040;
-                border-radius: 4px;
-                padding: 4px;
-                font-family: 'Consolas', 'Monaco', monospace;
-                font-size: 10px;
-            }
-        """)
+        self.output_area.setFont(monospace_font(9))
+        self.output_area.setObjectName("compactOutput")
 
         layout.addWidget(self.output_area, 1)
         self.setLayout(layout)
@@ -363,9 +321,9 @@ class CompactOutputWidget(QWidget):
         # Set color based on type
         format = QTextCharFormat()
         if output_type == "stderr":
-            format.setForeground(QColor("#f48fb1"))
+            format.setForeground(cached_qcolor(OUTPUT_COLORS["stderr"]))
         else:
-            format.setForeground(QColor("#4fc3f7"))
+            format.setForeground(cached_qcolor(OUTPUT_COLORS["stdout"]))
 
         cursor.setCharFormat(format)
         cursor.insertText(formatted_text + "\n")
@@ -382,7 +340,7 @@ class CompactOutputWidget(QWidget):
         timestamp = datetime.now().strftime("%H:%M:%S")
         cursor = self.output_area.textCursor()
         format = QTextCharFormat()
-        format.setForeground(QColor("#666666"))
+        format.setForeground(cached_qcolor("#666666"))
         cursor.setCharFormat(format)
         cursor.insertText(f"[{timestamp}] === Output cleared ===\n")
 
@@ -408,20 +366,10 @@ class LogViewerWidget(QWidget):
         layout.addWidget(filter_bar)
 
         # Log display
-        self.log_display = QTextEdit()
+        self.log_display = QPlainTextEdit()
         self.log_display.setReadOnly(True)
-        self.log_display.setFont(QFont("Consolas", 10))
-        self.log_display.setStyleSheet("""
-            QTextEdit {
-                background-color: #1e1e1e;
-                color: #ffffff;
-                border: 1px solid #404040;
-                border-radius: 4px;
-                padding: 8px;
-                font-family: 'Consolas', 'Monaco', monospace;
-                font-size: 10px;
-            }
-        """)
+        self.log_display.setFont(monospace_font(10))
+        self.log_display.setObjectName("logDisplay")
 
         layout.addWidget(self.log_display, 1)
         self.setLayout(layout)
@@ -429,14 +377,7 @@ class LogViewerWidget(QWidget):
     def create_filter_bar(self):
         """Create search and filter bar"""
         bar = QFrame()
-        bar.setStyleSheet("""
-            QFrame {
-                background-color: #f8f9fa;
-                border: 1px solid #dee2e6;
-                border-radius: 4px;
-                padding: 4px;
-            }
-        """)
+        bar.setObjectName("logFilterBar")
 
         layout = QHBoxLayout()
         layout.setContentsMargins(8, 4, 8, 4)
@@ -447,15 +388,7 @@ class LogViewerWidget(QWidget):
         self.search_input = QLineEdit()
         self.search_input.setPlaceholderText("🔍 Search logs...")
         self.search_input.textChanged.connect(self.on_search_changed)
-        self.search_input.setStyleSheet("""
-            QLineEdit {
-                padding: 4px 8px;
-                border: 1px solid #ced4da;
-                border-radius: 4px;
-                background-color: white;
-                font-size: 12px;
-            }
-        """)
+        self.search_input.setObjectName("logSearchInput")
         layout.addWidget(self.search_input, 1)
 
         # Filter buttons
@@ -466,32 +399,14 @@ class LogViewerWidget(QWidget):
             ("Error", "error")
         ]
 
+        self.filter_level_buttons = {}
         for text, level in filter_buttons:
             btn = QPushButton(text)
+            self.filter_level_buttons[level] = btn
             btn.setCheckable(True)
             btn.setChecked(level == "all")
             btn.clicked.connect(lambda checked, l=level: self.set_filter_level(l))
-            btn.setStyleSheet("""
-                QPushButton {
-                    padding: 4px 12px;
-                    border: 1px solid #ced4da;
-                    border-radius: 4px;
-                    background-color: white;
-                    font-size: 11px;
-                    font-weight: 600;
-                }
-                QPushButton:checked {
-                    background-color: #4f46e5;
-                    color: white;
-                    border-color: #4f46e5;
-                }
-                QPushButton:hover {
-                    background-color: #e9ecef;
-                }
-                QPushButton:checked:hover {
-                    background-color: #3730a3;
-                }
-            """)
+            btn.setObjectName("logFilterButton")
             layout.addWidget(btn)
 
         bar.setLayout(layout)
@@ -507,11 +422,9 @@ class LogViewerWidget(QWidget):
         self.filter_level = level
 
         # Update button states
-        parent = self.sender().parent()
-        for btn in parent.findChildren(QPushButton):
-            btn.setChecked(False)
+        for button_level, btn in self.filter_level_buttons.items():
+            btn.setChecked(button_level == level)
 
-        self.sender().setChecked(True)
         self.update_display()
 
     def add_log_entry(self, level, message, timestamp=None):
@@ -558,14 +471,7 @@ class LogViewerWidget(QWidget):
             message = entry['message']
 
             # Color coding
-            if entry['level'] == 'error':
-                color = "#f48fb1"
-            elif entry['level'] == 'warning':
-                color = "#ffb74d"
-            elif entry['level'] == 'info':
-                color = "#4fc3f7"
-            else:
-                color = "#ffffff"
+            color = LOG_LEVEL_COLORS.get(entry['level'], DEFAULT_TEXT_COLOR)
 
             formatted_line = f"[{timestamp_str}] {level}: {message}"
 
@@ -573,7 +479,7 @@ class LogViewerWidget(QWidget):
             cursor.movePosition(QTextCursor.MoveOperation.End)
 
             format = QTextCharFormat()
-            format.setForeground(QColor(color))
+            format.setForeground(cached_qcolor(color))
             cursor.setCharFormat(format)
             cursor.insertText(formatted_line + "\n")
 
@@ -0,0 +1,42 @@
+"""
+Gradient Frame - Header frame with a natively painted gradient
+"""
+
+from PyQt6.QtWidgets import QFrame
+from PyQt6.QtCore import Qt, QRectF
+from PyQt6.QtGui import QPainter, QLinearGradient, QGradient, QColor, QBrush
+
+
+def _make_gradient(x2, y2, start_color, stop_color):
+    """Build a gradient relative to the painted shape (0..1 coordinates)"""
+    gradient = QLinearGradient(0, 0, x2, y2)
+    gradient.setCoordinateMode(QGradient.CoordinateMode.ObjectBoundingMode)
+    gradient.setColorAt(0, QColor(start_color))
+    gradient.setColorAt(1, QColor(stop_color))
+    return QBrush(gradient)
+
+
+class GradientFrame(QFrame):
+    """QFrame painting its gradient with QPainter instead of qlineargradient QSS"""
+
+    SIDEBAR_GRADIENT = _make_gradient(0, 1, "#4f46e5", "#3730a3")
+    CATEGORY_GRADIENT = _make_gradient(1, 1, "#667eea", "#764ba2")
+
+    def __init__(self, gradient, radius=8, parent=None):
+        super().__init__(parent)
+        self.gradient = gradient
+        self.radius = radius
+
+    def paintEvent(self, event):
+        """Paint the rounded gradient background"""
+        super().paintEvent(event)
+
+        painter = QPainter(self)
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        painter.setPen(Qt.PenStyle.NoPen)
+        painter.setBrush(self.gradient)
+        painter.drawRoundedRect(QRectF(self.rect()), self.radius, self.radius)
+        painter.end()
+
+
+__all__ = ['GradientFrame']
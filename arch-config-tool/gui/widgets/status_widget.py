@@ -9,6 +9,16 @@ from PyQt6.QtCore import Qt, QTimer, pyqtSignal
 from PyQt6.QtGui import QFont
 import shutil
 import platform
+from collections import namedtuple
+
+PackageManager = namedtuple("PackageManager", "command icon title")
+
+PACKAGE_MANAGERS = (
+    PackageManager("pacman", "📦", "Pacman"),
+    PackageManager("flatpak", "📱", "Flatpak"),
+    PackageManager("yay", "🔧", "Yay"),
+    PackageManager("paru", "🔧", "Paru"),
+)
 
 class StatusWidget(QWidget):
     """System status and information widget"""
@@ -17,7 +27,9 @@ class StatusWidget(QWidget):
 
     def __init__(self):
         super().__init__()
+        self.status_rows = {}  # row key -> value label, built once and reused
         self.setup_ui()
+        self.add_system_info()
         self.setup_timer()
         self.update_status()
 
@@ -54,24 +66,35 @@ class StatusWidget(QWidget):
         self.timer.timeout.connect(self.update_status)
         self.timer.start(30000)  # Update every 30 seconds
 
+    def add_system_info(self):
+        """Add system rows once, they do not change while the app runs"""
+        self.set_status_item("system", "💻", "System", platform.system())
+        self.set_status_item("arch", "🏗️", "Architecture", platform.machine())
+
     def update_status(self):
         """Update system status information"""
-        # Clear existing status items
-        while self.status_layout.count():
-            child = self.status_layout.takeAt(0)
-            if child.widget():
-                child.widget().deleteLater()
-
-        # System info
-        self.add_status_item("💻", "System", platform.system())
-        self.add_status_item("🏗️", "Architecture", platform.machine())
+        # Freeze painting so all rows are redrawn in a single pass
+        self.status_container.setUpdatesEnabled(False)
 
-        # Package managers
+        # Package managers, these can be installed while the app runs
         self.add_package_manager_status()
 
+        self.status_container.setUpdatesEnabled(True)
+        self.status_container.update()
 
+    def set_status_item(self, key, icon, label, value, state="ok"):
+        """Create a status row on first use, afterwards only update its value"""
+        value_label = self.status_rows.get(key)
+        if value_label is None:
+            self.status_rows[key] = self.add_status_item(icon, label, value, state)
+            return
 
-    def add_status_item(self, icon, label, value, status_color="#28a745"):
+        value_label.setText(str(value))
+        if value_label.property("state") != state:
+            value_label.setProperty("state", state)
+            value_label.style().polish(value_label)
+
+    def add_status_item(self, icon, label, value, state="ok"):
         """Add a status item"""
         item_widget = QWidget()
         item_layout = QHBoxLayout()
@@ -85,32 +108,33 @@ class StatusWidget(QWidget):
 
         # Label
         label_widget = QLabel(label)
-        label_widget.setStyleSheet("font-size: 12px; color: #6c757d; font-weight: 600;")
+        label_widget.setObjectName("statusItemLabel")
         item_layout.addWidget(label_widget)
 
-        # Value
+        # Value (colored by the [state] selector in styles.css)
         value_label = QLabel(str(value))
-        value_label.setStyleSheet(f"font-size: 12px; color: {status_color}; font-weight: 600;")
+        value_label.setObjectName("statusItemValue")
+        value_label.setProperty("state", state)
         value_label.setAlignment(Qt.AlignmentFlag.AlignRight)
         item_layout.addWidget(value_label, 1)
 
         item_widget.setLayout(item_layout)
         self.status_layout.addWidget(item_widget)
+        return value_label
+
+    def probe_package_managers(self):
+        """Probe all package managers in one pass, returns {PackageManager: available}"""
+        return {manager: shutil.which(manager.command) is not None for manager in PACKAGE_MANAGERS}
 
     def add_package_manager_status(self):
         """Check and display package manager status"""
-        managers = {
-            "pacman": "📦",
-            "flatpak": "📱",
-            "yay": "🔧",
-            "paru": "🔧"
-        }
-
-        for manager, icon in managers.items():
-            if shutil.which(manager):
-                self.add_status_item(icon, manager.title(), "Available", "#28a745")
+        availability = self.probe_package_managers()
+
+        for manager, available in availability.items():
+            if available:
+                self.set_status_item(manager.command, manager.icon, manager.title, "Available", "ok")
             else:
-                self.add_status_item(icon, manager.title(), "Missing", "#dc3545")
+                self.set_status_item(manager.command, manager.icon, manager.title, "Missing", "missing")
 
 
 class QuickActionsWidget(QWidget):
@@ -134,13 +158,13 @@ class QuickActionsWidget(QWidget):
 
         # Label
         label_widget = QLabel(f"{label}:")
-        label_widget.setStyleSheet("font-size: 12px; color: #6c757d; font-weight: 600;")
+        label_widget.setObjectName("infoItemLabel")
         label_widget.setFixedWidth(80)
         item_layout.addWidget(label_widget)
 
         # Value
         value_label = QLabel(str(value))
-        value_label.setStyleSheet("font-size: 12px; color: #495057;")
+        value_label.setObjectName("infoItemValue")
         value_label.setWordWrap(True)
         item_layout.addWidget(value_label, 1)
 